@@ -6,18 +6,92 @@ Focused on Bitcoin options, perpetual futures, and institutional adoption
 """
 
 import os
+import io
 import time
+import heapq
+import asyncio
+import threading
 import schedule
 import logging
 import requests
 import feedparser
 import json
 import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from google.oauth2.service_account import Credentials
 import gspread
 
+# Optional: C-backed multi-pattern matcher for keyword scoring
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Optional: event-loop HTTP client for the feed fan-out
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Optional: C-backed XML parser for the feed hot path
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Optional: disk-persisted Bloom filter so dedup survives restarts
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+# Optional: JIT-compiled scoring kernel over integer keyword IDs
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+# Atom namespace prefix for lxml tag matching
+ATOM_NS = '{http://www.w3.org/2005/Atom}'
+
+# Text cleanup: one combined pattern for HTML tags and whitespace runs,
+# plus a translate table for the CSV-unsafe characters — compiled once at
+# import instead of per curator instance
+_CLEAN_RE = re.compile(r'<[^>]+>|\s+')
+_CLEAN_TRANS = str.maketrans({'"': "'", '\n': ' ', '\r': ' '})
+
+if njit is not None:
+    @njit(cache=True)
+    def _score_kernel(content_ids, title_ids, weights):
+        """Score from keyword-ID hit buffers: weights + match bonus + title bonus"""
+        score = 0
+        matched = 0
+        seen = np.zeros(weights.size, np.uint8)
+        for i in content_ids:
+            if not seen[i]:
+                seen[i] = 1
+                score += weights[i]
+                matched += 1
+
+        if matched > 1:
+            score += matched * 2
+
+        seen_title = np.zeros(weights.size, np.uint8)
+        for i in title_ids:
+            if not seen_title[i]:
+                seen_title[i] = 1
+                score += 3
+
+        return score
+else:
+    _score_kernel = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -62,6 +136,37 @@ class AttticusNewsCurator:
             'algorithmic trading': 5
         }
         
+        # Precompiled alternation so scoring scans each article once instead
+        # of running a substring search per keyword. The lookahead keeps
+        # overlapping phrases (e.g. "bitcoin options trading") all matchable.
+        self._kw_pattern = re.compile(
+            r'(?=(' + '|'.join(re.escape(kw) for kw in self.keywords) + r'))',
+            re.IGNORECASE
+        )
+
+        # Stable integer IDs per keyword so the scoring kernel can work on
+        # int buffers instead of strings
+        self._kw_list = list(self.keywords)
+        self._kw_id = {keyword: i for i, keyword in enumerate(self._kw_list)}
+
+        # Aho-Corasick automaton: shared trie over all keywords, built once
+        # and reused for every article (single linear scan per text)
+        if ahocorasick is not None:
+            self._kw_automaton = ahocorasick.Automaton()
+            for keyword in self._kw_list:
+                self._kw_automaton.add_word(keyword, (self._kw_id[keyword], keyword))
+            self._kw_automaton.make_automaton()
+        else:
+            self._kw_automaton = None
+
+        # Weight vector for the JIT kernel, plus a warm-up call so the
+        # one-time compile cost is paid at startup rather than mid-run
+        if _score_kernel is not None:
+            self._kw_weights = np.array([self.keywords[k] for k in self._kw_list], dtype=np.int32)
+            _score_kernel(np.empty(0, np.int32), np.empty(0, np.int32), self._kw_weights)
+        else:
+            self._kw_weights = None
+
         # Premium crypto news RSS feeds
         self.feeds = [
             'https://cointelegraph.com/rss',
@@ -74,8 +179,29 @@ class AttticusNewsCurator:
             'https://bitcoinmagazine.com/.rss/full/'
         ]
         
-        # Track processed articles to avoid duplicates
-        self.processed_articles = set()
+        # Track processed articles to avoid duplicates: an OrderedDict used
+        # as a bounded LRU, so the oldest IDs age out automatically instead
+        # of needing a periodic cleanup job
+        # (guarded by a lock since feeds are fetched concurrently)
+        self.processed_articles = OrderedDict()
+        self._processed_lock = threading.Lock()
+
+        # Disk-backed Bloom filter remembers seen IDs across restarts, so a
+        # redeploy doesn't re-add articles already sent to the sheet
+        self._bloom_path = os.environ.get('PROCESSED_CACHE_PATH', 'processed_articles.bloom')
+        self._seen_bloom = self._load_seen_bloom()
+
+        # Conditional GET cache: feed URL -> (etag, last-modified) so
+        # unchanged feeds answer 304 and skip download + parse entirely
+        self._feed_cache = {}
+
+        # Persistent HTTP session: keep-alive connections and gzip for free
+        self._http = requests.Session()
+        self._http.headers['User-Agent'] = 'Atticus/1.0'
+
+        # The sheet itself is the source of truth for what was already
+        # added — seed the dedup cache from it so restarts can't re-append
+        self._seed_processed_from_sheet()
         
     def setup_google_sheets(self):
         """Setup Google Sheets connection using environment variables"""
@@ -85,7 +211,7 @@ class AttticusNewsCurator:
                 "type": "service_account",
                 "project_id": os.environ['GOOGLE_PROJECT_ID'],
                 "private_key_id": os.environ['GOOGLE_PRIVATE_KEY_ID'], 
-                "private_key": os.environ['GOOGLE_PRIVATE_KEY'].replace('\\\\n', '\\n'),
+                "private_key": os.environ['GOOGLE_PRIVATE_KEY'].replace('\\n', '\n'),
                 "client_email": os.environ['GOOGLE_CLIENT_EMAIL'],
                 "client_id": os.environ['GOOGLE_CLIENT_ID'],
                 "auth_uri": "https://accounts.google.com/o/oauth2/auth",
@@ -109,10 +235,12 @@ class AttticusNewsCurator:
             self.sheet = self.gc.open_by_key(sheet_id).sheet1
             
             logger.info("✅ Google Sheets connected successfully")
-            
-            # Test connection by reading first row
-            headers = self.sheet.row_values(1)
-            logger.info(f"📊 Sheet headers: {headers}")
+
+            # Test connection by reading first row — this is a full Sheets
+            # API round-trip, so only pay for it when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                headers = self.sheet.row_values(1)
+                logger.debug(f"📊 Sheet headers: {headers}")
             
         except KeyError as e:
             logger.error(f"❌ Missing environment variable: {e}")
@@ -121,50 +249,159 @@ class AttticusNewsCurator:
             logger.error(f"❌ Google Sheets setup failed: {e}")
             raise
             
-    def clean_text(self, text: str) -> str:
-        """Clean HTML tags and excessive whitespace from text"""
+    def _seed_processed_from_sheet(self):
+        """Seed the dedup cache with links already present in the sheet"""
+        try:
+            # One batch read of the Reference Link column (minus the header)
+            existing_links = self.sheet.col_values(2)[1:]
+
+            with self._processed_lock:
+                for link in existing_links:
+                    if link:
+                        self.processed_articles[link] = None
+                while len(self.processed_articles) > 1000:
+                    self.processed_articles.popitem(last=False)
+
+            logger.info(f"🔁 Seeded dedup cache with {len(existing_links)} existing sheet links")
+
+        except Exception as e:
+            logger.warning(f"⚠️ Could not seed dedup cache from sheet: {e}")
+
+    def _load_seen_bloom(self):
+        """Load the persisted seen-articles Bloom filter, or start a fresh one"""
+        if ScalableBloomFilter is None:
+            return None
+
+        try:
+            if os.path.exists(self._bloom_path):
+                with open(self._bloom_path, 'rb') as f:
+                    bloom = ScalableBloomFilter.fromfile(f)
+                logger.info(f"💾 Loaded seen-articles filter ({len(bloom)} entries)")
+                return bloom
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load seen-articles filter, starting fresh: {e}")
+
+        return ScalableBloomFilter(initial_capacity=100000, error_rate=0.01)
+
+    def _save_seen_bloom(self):
+        """Persist the seen-articles Bloom filter to disk"""
+        if self._seen_bloom is None:
+            return
+
+        try:
+            with open(self._bloom_path, 'wb') as f:
+                self._seen_bloom.tofile(f)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not save seen-articles filter: {e}")
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def clean_text(text: str) -> str:
+        """Clean HTML tags and excessive whitespace from text
+
+        Memoized: feeds re-emit the same articles across runs, so repeat
+        inputs skip the regex/translate passes entirely.
+        """
         if not text:
             return ""
-            
-        # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Remove excessive whitespace
-        text = re.sub(r'\\s+', ' ', text)
-        
-        # Remove special characters that might break CSV
-        text = text.replace('"', "'").replace('\\n', ' ').replace('\\r', ' ')
-        
-        return text.strip()
-        
-    def calculate_article_score(self, title: str, summary: str) -> tuple:
-        """Calculate relevance score for an article based on keywords"""
-        content = f"{title} {summary}".lower()
-        score = 0
-        matched_keywords = []
-        
-        # Score based on keyword matches
-        for keyword, weight in self.keywords.items():
-            if keyword in content:
-                score += weight
-                matched_keywords.append(keyword)
-                
+
+        # Drop HTML tags and collapse whitespace in one pass, then swap out
+        # special characters that might break CSV
+        text = _CLEAN_RE.sub(
+            lambda m: '' if m.group(0).startswith('<') else ' ',
+            text
+        )
+        return text.translate(_CLEAN_TRANS).strip()
+
+    def _find_keywords(self, text: str) -> set:
+        """Find all distinct keywords in lowercased text with one linear scan"""
+        if self._kw_automaton is not None:
+            return set(keyword for _, (_, keyword) in self._kw_automaton.iter(text))
+        return set(hit.lower() for hit in self._kw_pattern.findall(text))
+
+    def _iter_keywords(self, text: str):
+        """Yield keyword hits in lowercased text lazily, in scan order"""
+        if self._kw_automaton is not None:
+            for _, (_, keyword) in self._kw_automaton.iter(text):
+                yield keyword
+        else:
+            for match in self._kw_pattern.finditer(text):
+                yield match.group(1).lower()
+
+    def _find_keyword_ids(self, text: str) -> list:
+        """Find all keyword hits in lowercased text as integer IDs (with repeats)"""
+        if self._kw_automaton is not None:
+            return [kw_id for _, (kw_id, _) in self._kw_automaton.iter(text)]
+        return [self._kw_id[hit.lower()] for hit in self._kw_pattern.findall(text)]
+
+    def calculate_article_score(self, title: str, summary: str,
+                                threshold: Optional[int] = None) -> tuple:
+        """Calculate relevance score for an article based on keywords
+
+        When threshold is given the caller only needs accept/reject, so
+        scoring stops as soon as the running score reaches it; the returned
+        score is then a lower bound, not the full score.
+        """
+        # Lowercase each field exactly once and scan them separately —
+        # no concatenated throwaway copy of title + summary
+        title_lower = title.lower()
+        summary_lower = summary.lower()
+
+        if threshold is not None:
+            score = 0
+            matched = set()
+
+            # Stop scanning as soon as the threshold is reached; title hits
+            # carry their weight plus the +3 visibility bonus
+            for keyword in self._iter_keywords(title_lower):
+                if keyword not in matched:
+                    matched.add(keyword)
+                    score += self.keywords[keyword] + 3
+                    if score >= threshold:
+                        return score, sorted(matched)
+
+            for keyword in self._iter_keywords(summary_lower):
+                if keyword not in matched:
+                    matched.add(keyword)
+                    score += self.keywords[keyword]
+                    if score >= threshold:
+                        return score, sorted(matched)
+
+            if len(matched) > 1:
+                score += len(matched) * 2
+
+            return score, sorted(matched)
+
+        if _score_kernel is not None:
+            # Hand the hit buffers to the compiled kernel
+            title_hits = self._find_keyword_ids(title_lower)
+            content_ids = np.array(title_hits + self._find_keyword_ids(summary_lower), dtype=np.int32)
+            title_ids = np.array(title_hits, dtype=np.int32)
+
+            score = int(_score_kernel(content_ids, title_ids, self._kw_weights))
+            matched_keywords = sorted(self._kw_list[i] for i in set(content_ids.tolist()))
+            return score, matched_keywords
+
+        # One pass over each field finds every keyword hit at once
+        title_keywords = self._find_keywords(title_lower)
+        matched_keywords = sorted(title_keywords | self._find_keywords(summary_lower))
+        score = sum(self.keywords[keyword] for keyword in matched_keywords)
+
         # Bonus points for multiple keyword matches
         if len(matched_keywords) > 1:
             score += len(matched_keywords) * 2
-            
+
         # Bonus for title matches (more visible)
-        title_lower = title.lower()
-        for keyword in self.keywords:
-            if keyword in title_lower:
-                score += 3
-                
+        score += 3 * len(title_keywords)
+
         return score, matched_keywords
         
-    def create_sample_copy(self, title: str, summary: str, max_length: int = 140) -> str:
-        """Create concise sample copy for social media/content use"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def create_sample_copy(title: str, summary: str, max_length: int = 140) -> str:
+        """Create concise sample copy for social media/content use (memoized)"""
         # Clean the summary text
-        clean_summary = self.clean_text(summary)
+        clean_summary = AttticusNewsCurator.clean_text(summary)
         
         # If summary is too short, use title + summary
         if len(clean_summary) < 50:
@@ -178,83 +415,245 @@ class AttticusNewsCurator:
         else:
             return combined
             
+    def _parse_feed_lxml(self, content: bytes, limit: int = 10) -> tuple:
+        """Stream-parse RSS/Atom bytes with lxml, extracting only the fields we use"""
+        source = 'Unknown Source'
+        entries = []
+
+        context = etree.iterparse(io.BytesIO(content), events=('end',), recover=True)
+        for _, elem in context:
+            tag = elem.tag
+
+            # The channel/feed title ends before the first item/entry
+            if not entries and tag in ('title', ATOM_NS + 'title') and source == 'Unknown Source':
+                source = (elem.text or '').strip() or 'Unknown Source'
+
+            elif tag == 'item':
+                entries.append({
+                    'id': elem.findtext('guid'),
+                    'title': elem.findtext('title') or '',
+                    'link': (elem.findtext('link') or '').strip(),
+                    'summary': elem.findtext('description') or '',
+                    'published': elem.findtext('pubDate') or 'Unknown'
+                })
+                elem.clear()
+
+            elif tag == ATOM_NS + 'entry':
+                link = ''
+                for link_elem in elem.findall(ATOM_NS + 'link'):
+                    if link_elem.get('rel', 'alternate') == 'alternate':
+                        link = link_elem.get('href', '')
+                        break
+                entries.append({
+                    'id': elem.findtext(ATOM_NS + 'id'),
+                    'title': elem.findtext(ATOM_NS + 'title') or '',
+                    'link': link,
+                    'summary': elem.findtext(ATOM_NS + 'summary') or elem.findtext(ATOM_NS + 'content') or '',
+                    'published': elem.findtext(ATOM_NS + 'published') or elem.findtext(ATOM_NS + 'updated') or 'Unknown'
+                })
+                elem.clear()
+
+            # Stop early once we have enough recent articles
+            if len(entries) >= limit:
+                break
+
+        return source, entries
+
+    def _parse_feed_feedparser(self, content: bytes, limit: int = 10) -> tuple:
+        """Fallback parser: feedparser over raw bytes, normalized to plain dicts"""
+        feed = feedparser.parse(content)
+        source = feed.feed.get('title', 'Unknown Source')
+
+        entries = []
+        for entry in feed.entries[:limit]:
+            entries.append({
+                'id': entry.get('id'),
+                'title': entry.get('title', ''),
+                'link': entry.get('link', ''),
+                'summary': entry.get('summary', entry.get('description', '')),
+                'published': entry.get('published', 'Unknown')
+            })
+
+        return source, entries
+
+    def _parse_feed(self, content: bytes) -> tuple:
+        """Parse feed bytes into (source title, entry dicts)"""
+        if etree is not None:
+            return self._parse_feed_lxml(content)
+        return self._parse_feed_feedparser(content)
+
+    def _conditional_headers(self, feed_url: str) -> Dict:
+        """Build If-None-Match/If-Modified-Since headers from the feed cache"""
+        headers = {}
+        etag, modified = self._feed_cache.get(feed_url, (None, None))
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+        return headers
+
     def fetch_articles_from_feed(self, feed_url: str) -> List[Dict]:
         """Fetch articles from a single RSS feed"""
-        articles = []
-        
         try:
             logger.info(f"📰 Fetching from: {feed_url}")
-            
-            # Parse RSS feed with timeout
-            feed = feedparser.parse(feed_url)
-            
-            if not feed.entries:
+
+            # Conditional GET: send cached ETag/Last-Modified so the
+            # server can answer 304 when nothing has changed
+            response = self._http.get(feed_url, headers=self._conditional_headers(feed_url),
+                                      timeout=10)
+
+            if response.status_code == 304:
+                logger.info(f"⏭️ Feed unchanged since last run: {feed_url}")
+                return []
+
+            response.raise_for_status()
+
+            # Remember validators for the next conditional request
+            self._feed_cache[feed_url] = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+
+            return self._process_feed_content(feed_url, response.content)
+
+        except Exception as e:
+            logger.error(f"❌ Error fetching feed {feed_url}: {e}")
+            return []
+
+    def _process_feed_content(self, feed_url: str, content: bytes) -> List[Dict]:
+        """Parse feed bytes and score the entries into curated articles"""
+        articles = []
+
+        try:
+            # Process recent articles (last 10 from each feed)
+            source, entries = self._parse_feed(content)
+
+            if not entries:
                 logger.warning(f"⚠️ No entries found in feed: {feed_url}")
                 return articles
-                
-            # Process recent articles (last 10 from each feed)
-            for entry in feed.entries[:10]:
+
+            for entry in entries:
                 try:
-                    # Skip if we've already processed this article
-                    article_id = entry.get('id', entry.link)
-                    if article_id in self.processed_articles:
+                    # Skip if we've already processed this article — the or
+                    # chain falls through when the id key is present but empty.
+                    # The link is checked too because the sheet-seeded entries
+                    # are keyed by link while feeds may key by guid.
+                    article_id = entry.get('id') or entry.get('link')
+                    article_link = entry.get('link')
+                    with self._processed_lock:
+                        if article_id in self.processed_articles:
+                            continue
+                        if article_link and article_link in self.processed_articles:
+                            continue
+                        if self._seen_bloom is not None and article_id in self._seen_bloom:
+                            continue
+
+                    # Cheap prefilter on the raw text: most entries have zero
+                    # keyword hits, so skip cleaning and scoring outright when
+                    # neither the title nor the summary contains one
+                    if not self._kw_pattern.search(entry['title']) \
+                            and not self._kw_pattern.search(entry['summary']):
                         continue
-                        
+
                     # Extract article data
-                    title = self.clean_text(entry.title)
-                    summary = self.clean_text(entry.get('summary', entry.get('description', '')))
-                    
+                    title = self.clean_text(entry['title'])
+                    summary = self.clean_text(entry['summary'])
+
                     # Calculate relevance score
                     score, matched_keywords = self.calculate_article_score(title, summary)
-                    
+
                     # Only include articles with sufficient relevance (score >= 8)
                     if score >= 8:
                         sample_copy = self.create_sample_copy(title, summary)
-                        
+
                         articles.append({
                             'id': article_id,
                             'title': title,
-                            'link': entry.link,
+                            'link': entry['link'],
                             'sample_copy': sample_copy,
                             'score': score,
                             'matched_keywords': matched_keywords,
-                            'published': entry.get('published', 'Unknown'),
-                            'source': feed.feed.get('title', 'Unknown Source')
+                            'published': entry['published'],
+                            'source': source
                         })
-                        
-                        # Mark as processed
-                        self.processed_articles.add(article_id)
-                        
+
+                        # Mark as processed, evicting the oldest IDs once
+                        # the cache passes its bound
+                        with self._processed_lock:
+                            self.processed_articles[article_id] = None
+                            self.processed_articles.move_to_end(article_id)
+                            while len(self.processed_articles) > 1000:
+                                self.processed_articles.popitem(last=False)
+                            if self._seen_bloom is not None:
+                                self._seen_bloom.add(article_id)
+
                 except Exception as e:
                     logger.error(f"❌ Error processing entry from {feed_url}: {e}")
                     continue
-                    
+
         except Exception as e:
-            logger.error(f"❌ Error fetching feed {feed_url}: {e}")
-            
+            logger.error(f"❌ Error parsing feed {feed_url}: {e}")
+
         return articles
+
+    async def _fetch_feed_async(self, session, feed_url: str) -> Optional[bytes]:
+        """Fetch one feed's bytes on the event loop (None when unchanged)"""
+        async with session.get(feed_url, headers=self._conditional_headers(feed_url)) as response:
+            if response.status == 304:
+                logger.info(f"⏭️ Feed unchanged since last run: {feed_url}")
+                return None
+
+            response.raise_for_status()
+
+            self._feed_cache[feed_url] = (
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified')
+            )
+
+            return await response.read()
+
+    async def _fetch_all_async(self) -> List:
+        """Fetch every feed concurrently on one event loop"""
+        timeout = aiohttp.ClientTimeout(total=10)
+        headers = {'User-Agent': 'Atticus/1.0'}
+
+        async with aiohttp.ClientSession(timeout=timeout, headers=headers) as session:
+            tasks = [self._fetch_feed_async(session, feed_url) for feed_url in self.feeds]
+            return await asyncio.gather(*tasks, return_exceptions=True)
         
     def fetch_all_articles(self) -> List[Dict]:
         """Fetch articles from all RSS feeds"""
         all_articles = []
-        
-        for feed_url in self.feeds:
-            try:
-                articles = self.fetch_articles_from_feed(feed_url)
-                all_articles.extend(articles)
-                
-                # Rate limiting to be respectful to RSS servers
-                time.sleep(1.0)
-                
-            except Exception as e:
-                logger.error(f"❌ Failed to fetch from {feed_url}: {e}")
-                continue
-                
-        # Sort by relevance score (highest first)
-        all_articles.sort(key=lambda x: x['score'], reverse=True)
-        
-        # Return top articles (max 5 per run to avoid overwhelming the sheet)
-        return all_articles[:5]
+
+        # Feeds are on distinct hosts, so fetch them concurrently — wall time
+        # becomes the slowest feed instead of the sum of all of them. The
+        # event loop multiplexes all requests on one thread; the thread pool
+        # is the fallback when aiohttp is not installed.
+        if aiohttp is not None:
+            logger.info(f"📰 Fetching {len(self.feeds)} feeds concurrently...")
+            results = asyncio.run(self._fetch_all_async())
+
+            for feed_url, result in zip(self.feeds, results):
+                if isinstance(result, Exception):
+                    logger.error(f"❌ Failed to fetch from {feed_url}: {result}")
+                elif result is not None:
+                    all_articles.extend(self._process_feed_content(feed_url, result))
+        else:
+            with ThreadPoolExecutor(max_workers=len(self.feeds)) as executor:
+                futures = {
+                    executor.submit(self.fetch_articles_from_feed, feed_url): feed_url
+                    for feed_url in self.feeds
+                }
+
+                for future in as_completed(futures):
+                    try:
+                        all_articles.extend(future.result())
+                    except Exception as e:
+                        logger.error(f"❌ Failed to fetch from {futures[future]}: {e}")
+
+        # Top articles by relevance score (max 5 per run to avoid
+        # overwhelming the sheet) — no need to sort the full list
+        return heapq.nlargest(5, all_articles, key=lambda x: x['score'])
         
     def add_articles_to_sheet(self, articles: List[Dict]):
         """Add curated articles to Google Sheets"""
@@ -264,35 +663,26 @@ class AttticusNewsCurator:
             
         try:
             today = datetime.now().strftime('%Y-%m-%d')
-            added_count = 0
-            
+
+            # Prepare all rows up front so we can write them in one API call
+            rows = []
             for article in articles:
-                try:
-                    # Prepare row data matching your sheet format
-                    row_data = [
-                        today,                      # Date Added
-                        article['link'],            # Reference Link  
-                        article['sample_copy'],     # Sample Copy
-                        '',                         # Empty column 1
-                        '',                         # Empty column 2
-                        ''                          # Empty column 3
-                    ]
-                    
-                    # Add row to sheet
-                    self.sheet.append_row(row_data)
-                    added_count += 1
-                    
-                    logger.info(f"✅ Added: {article['title'][:60]}... (Score: {article['score']})")
-                    logger.info(f"🎯 Keywords: {', '.join(article['matched_keywords'][:3])}")
-                    
-                    # Rate limiting to prevent API quota issues
-                    time.sleep(2.0)
-                    
-                except Exception as e:
-                    logger.error(f"❌ Failed to add article: {e}")
-                    continue
-                    
-            logger.info(f"📊 Successfully added {added_count} articles to sheet")
+                rows.append([
+                    today,                      # Date Added
+                    article['link'],            # Reference Link
+                    article['sample_copy'],     # Sample Copy
+                    '',                         # Empty column 1
+                    '',                         # Empty column 2
+                    ''                          # Empty column 3
+                ])
+
+                logger.info(f"✅ Adding: {article['title'][:60]}... (Score: {article['score']})")
+                logger.info(f"🎯 Keywords: {', '.join(article['matched_keywords'][:3])}")
+
+            # Single batch append instead of one API call per article
+            self.sheet.append_rows(rows, value_input_option='RAW', insert_data_option='INSERT_ROWS')
+
+            logger.info(f"📊 Successfully added {len(rows)} articles to sheet")
             
         except Exception as e:
             logger.error(f"❌ Failed to add articles to sheet: {e}")
@@ -322,18 +712,12 @@ class AttticusNewsCurator:
                 
             else:
                 logger.info("📭 No articles met relevance threshold today")
-                
+
+            # Flush the seen-articles filter so dedup survives a restart
+            self._save_seen_bloom()
+
         except Exception as e:
             logger.error(f"💥 Curation run failed: {e}")
-            
-    def cleanup_processed_articles(self):
-        """Clean up old processed article IDs to prevent memory bloat"""
-        # Keep only recent processed articles (last 1000)
-        if len(self.processed_articles) > 1000:
-            # Convert to list, keep last 500, convert back to set
-            recent_articles = list(self.processed_articles)[-500:]
-            self.processed_articles = set(recent_articles)
-            logger.info("🧹 Cleaned up processed articles cache")
 
 def main():
     """Main application loop for Render Background Worker"""
@@ -346,12 +730,9 @@ def main():
         # Schedule curation runs
         # 9:00 AM EST
         schedule.every().day.at("14:00").do(curator.run_curation)  # 9 AM EST = 2 PM UTC
-        # 3:00 PM EST  
+        # 3:00 PM EST
         schedule.every().day.at("20:00").do(curator.run_curation)  # 3 PM EST = 8 PM UTC
-        
-        # Daily cleanup
-        schedule.every().day.at("06:00").do(curator.cleanup_processed_articles)
-        
+
         logger.info("⏰ Scheduled for 9:00 AM and 3:00 PM EST daily")
         
         # Run initial curation for testing
@@ -125,7 +125,7 @@ def test_article_scoring():
 
 def run_full_test():
     """Run complete test suite"""
-    print("🚀 Starting Atticus News Curator Test Suite\\n")
+    print("🚀 Starting Atticus News Curator Test Suite\n")
     
     tests = [
         ("Environment Variables", test_environment_variables),
@@ -161,7 +161,7 @@ def run_full_test():
         if result:
             passed += 1
     
-    print(f"\\nOverall: {passed}/{len(results)} tests passed")
+    print(f"\nOverall: {passed}/{len(results)} tests passed")
     
     if passed == len(results):
         print("🎉 All tests passed! Ready for deployment.")
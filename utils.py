@@ -9,22 +9,19 @@ import json
 from datetime import datetime, timedelta
 from main import AttticusNewsCurator
 
-def manual_curation_run():
+def manual_curation_run(curator):
     """Run a manual curation cycle"""
     print("🚀 Starting manual curation run...")
     
     try:
-        curator = AttticusNewsCurator()
         curator.run_curation()
         print("✅ Manual curation completed successfully")
     except Exception as e:
         print(f"❌ Manual curation failed: {e}")
 
-def view_recent_articles():
+def view_recent_articles(curator):
     """View recent articles in the Google Sheet"""
     try:
-        curator = AttticusNewsCurator()
-        
         # Get last 10 rows
         all_values = curator.sheet.get_all_values()
         recent_rows = all_values[-10:] if len(all_values) > 10 else all_values[1:]
@@ -41,19 +38,28 @@ def view_recent_articles():
     except Exception as e:
         print(f"❌ Failed to view articles: {e}")
 
-def clear_processed_cache():
+def clear_processed_cache(curator):
     """Clear the processed articles cache"""
     try:
-        curator = AttticusNewsCurator()
         curator.processed_articles.clear()
+
+        # Reset the persistent seen-articles filter too — deleting the file
+        # before reloading leaves a fresh, empty filter
+        if os.path.exists(curator._bloom_path):
+            os.remove(curator._bloom_path)
+        curator._seen_bloom = curator._load_seen_bloom()
+
+        # Drop cached ETag/Last-Modified validators so the next fetch can't
+        # skip feeds with a 304 while we're trying to re-process them
+        curator._feed_cache.clear()
+
         print("✅ Processed articles cache cleared")
     except Exception as e:
         print(f"❌ Failed to clear cache: {e}")
 
-def test_single_feed(feed_url):
+def test_single_feed(curator, feed_url):
     """Test fetching from a single RSS feed"""
     try:
-        curator = AttticusNewsCurator()
         articles = curator.fetch_articles_from_feed(feed_url)
         
         print(f"📰 Results from {feed_url}:")
@@ -65,10 +71,9 @@ def test_single_feed(feed_url):
     except Exception as e:
         print(f"❌ Feed test failed: {e}")
 
-def export_sheet_data():
+def export_sheet_data(curator):
     """Export current sheet data to JSON"""
     try:
-        curator = AttticusNewsCurator()
         all_values = curator.sheet.get_all_values()
         
         # Convert to list of dictionaries
@@ -97,7 +102,7 @@ def export_sheet_data():
 
 def show_menu():
     """Show interactive menu"""
-    print("\\n🔧 Atticus News Curator - Utility Menu")
+    print("\n🔧 Atticus News Curator - Utility Menu")
     print("=" * 50)
     print("1. Run manual curation")
     print("2. View recent articles") 
@@ -109,22 +114,30 @@ def show_menu():
 
 def main():
     """Interactive utility menu"""
+    # One curator (and one Sheets handshake) for the whole session instead
+    # of reconnecting on every menu choice
+    try:
+        curator = AttticusNewsCurator()
+    except Exception as e:
+        print(f"❌ Failed to initialize curator: {e}")
+        return
+
     while True:
         show_menu()
-        choice = input("\\nSelect option (1-6): ").strip()
+        choice = input("\nSelect option (1-6): ").strip()
         
         if choice == '1':
-            manual_curation_run()
+            manual_curation_run(curator)
         elif choice == '2':
-            view_recent_articles()
+            view_recent_articles(curator)
         elif choice == '3':
-            clear_processed_cache()
+            clear_processed_cache(curator)
         elif choice == '4':
             feed_url = input("Enter RSS feed URL: ").strip()
             if feed_url:
-                test_single_feed(feed_url)
+                test_single_feed(curator, feed_url)
         elif choice == '5':
-            export_sheet_data()
+            export_sheet_data(curator)
         elif choice == '6':
             print("👋 Goodbye!")
             break